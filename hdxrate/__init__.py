@@ -4,4 +4,10 @@ __author__ = """Jochem Smit"""
 __email__ = "jhsmit@gmail.com"
 __version__ = "0.2.3"
 
-from .hdxrate import k_int_from_sequence
+from .hdxrate import (
+    k_int_from_sequence,
+    k_int_from_sequences,
+    peptide_statistics,
+    BatchRates,
+    RateGrid,
+)
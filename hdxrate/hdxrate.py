@@ -18,6 +18,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import numpy as np
+from functools import lru_cache
 from pathlib import Path
 
 R = 1.987
@@ -55,6 +56,43 @@ rates_cat = {
 }
 
 
+@lru_cache(maxsize=None)
+def _load_side_chain_constants():
+    """Reads the side chain constants table from `constants.txt`."""
+    root_dir = Path(__file__).parent
+    names = ["name", "short_name", "acid_lambda", "acid_rho", "base_lambda", "base_rho"]
+    side_chain_array = np.genfromtxt(
+        root_dir / "constants.txt",
+        comments="#",
+        skip_header=2,
+        delimiter="\t",
+        dtype=None,
+        names=names,
+        encoding=None,
+        autostrip=True,
+    )
+    side_chain_array.flags.writeable = False
+
+    return side_chain_array
+
+
+def _corrected_pKa(k_reference, activation_energy, temperature):
+    """Temperature corrected pKa of an ionizable side chain."""
+    return -np.log10(
+        10**-k_reference * np.exp(-activation_energy * (1 / temperature - 1 / 278) / R)
+    )  # Check correct reference temperature
+
+
+def _ionization_modifier(protenated, deprotenated, pH, k_corrected):
+    """Side chain modifier weighted by the protonated and deprotonated populations."""
+    return np.log10(
+        np.divide(
+            10 ** (protenated - pH) + 10 ** (deprotenated - k_corrected),
+            10**-k_corrected + 10**-pH,
+        )
+    )
+
+
 def get_side_chain_dictionary(temperature, pH, k_reference, activation_energy):
     """
     Returns a dictionary with inductive effects of side chains on H/D exchange rates.
@@ -90,18 +128,7 @@ def get_side_chain_dictionary(temperature, pH, k_reference, activation_energy):
        Exchange Rates. J. Am. Soc. Mass Spectrom. 29, 1936–1939 (2018).
     """
 
-    root_dir = Path(__file__).parent
-    names = ["name", "short_name", "acid_lambda", "acid_rho", "base_lambda", "base_rho"]
-    side_chain_array = np.genfromtxt(
-        root_dir / "constants.txt",
-        comments="#",
-        skip_header=2,
-        delimiter="\t",
-        dtype=None,
-        names=names,
-        encoding=None,
-        autostrip=True,
-    )
+    side_chain_array = _load_side_chain_constants()
 
     side_chain_dict = {
         elem["short_name"]: np.array(list(elem)[2:]) for elem in side_chain_array
@@ -111,28 +138,17 @@ def get_side_chain_dictionary(temperature, pH, k_reference, activation_energy):
         "E",
         "H",
     ]:  # residues D, E, H are calculated based on pH and pKa
-        k_corrected = -np.log10(
-            10 ** -k_reference[residue]
-            * np.exp(-activation_energy[residue] * (1 / temperature - 1 / 278) / R)
-        )  # Check correct reference temperature
+        k_corrected = _corrected_pKa(
+            k_reference[residue], activation_energy[residue], temperature
+        )
 
         deprotenated = side_chain_dict[residue + "0"]
         protenated = side_chain_dict[residue + "+"]
 
-        values = np.log10(
-            np.divide(
-                10 ** (protenated - pH) + 10 ** (deprotenated - k_corrected),
-                10**-k_corrected + 10**-pH,
-            )
-        )
+        values = _ionization_modifier(protenated, deprotenated, pH, k_corrected)
         side_chain_dict[residue] = values
         if residue == "E":
-            side_chain_dict["CT"][0] = np.log10(
-                np.divide(
-                    10 ** (0.05 - pH) + 10 ** (0.96 - k_corrected),
-                    10**-k_corrected + 10**-pH,
-                )
-            )
+            side_chain_dict["CT"][0] = _ionization_modifier(0.05, 0.96, pH, k_corrected)
 
     return side_chain_dict
 
@@ -169,6 +185,48 @@ def correct_pH(pH_read, d_percentage=100.0):
     return pH_corrected
 
 
+def _exchange_parameters(exchange_type, pH_read, d_percentage, ph_correction):
+    """
+    Returns pD, pKD, side chain reference pKa values and activation energies for the given exchange type.
+    """
+    activation_energy = E_act.copy()
+    if exchange_type == "HD":
+        pD = correct_pH(pH_read, d_percentage) if ph_correction else pH_read
+        pKD = 15.05
+        k_reference = {"D": 4.48, "E": 4.93, "H": 7.42}  # HD
+        activation_energy["D"] = D_E_act["D_HD"]
+    elif exchange_type == "DH":
+        pD = pH_read
+        pKD = 14.17
+        k_reference = {"D": 3.87, "E": 4.33, "H": 7.0}  # DH
+        activation_energy["D"] = D_E_act["D_DH"]
+    elif exchange_type == "HH":
+        pD = pH_read
+        pKD = 14.17
+        k_reference = {"D": 3.88, "E": 4.35, "H": 7.11}  # HH
+        activation_energy["D"] = D_E_act["D_HH"]
+    else:
+        raise ValueError(f"Unsupported exchange type '{exchange_type}'")
+
+    return pD, pKD, k_reference, activation_energy
+
+
+def _reference_rates(temperature, reference, exchange_type):
+    """
+    Returns acid, base and water catalysed reference rates, corrected for temperature.
+    """
+    try:
+        k_acid_ref, k_base_ref, k_water_ref = rates_cat[(exchange_type, reference)]
+    except KeyError:
+        raise
+
+    k_acid = k_acid_ref * np.exp(-E_act["acid"] * (1 / temperature - 1 / 293) / R)
+    k_base = k_base_ref * np.exp(-E_act["base"] * (1 / temperature - 1 / 293) / R)
+    k_water = k_water_ref * np.exp(-E_act["water"] * (1 / temperature - 1 / 293) / R)
+
+    return k_acid, k_base, k_water
+
+
 def k_int_from_sequence(
     sequence,
     temperature,
@@ -235,41 +293,19 @@ def k_int_from_sequence(
     if len(sequence) < 3:
         raise ValueError("Sequence needs a minimum length of 3")
 
-    activation_energy = E_act.copy()
-    if exchange_type == "HD":
-        pD = correct_pH(pH_read, d_percentage) if ph_correction else pH_read
-        pKD = 15.05
-        k_reference = {"D": 4.48, "E": 4.93, "H": 7.42}  # HD
-        activation_energy["D"] = D_E_act["D_HD"]
-    elif exchange_type == "DH":
-        pD = pH_read
-        pKD = 14.17
-        k_reference = {"D": 3.87, "E": 4.33, "H": 7.0}  # DH
-        activation_energy["D"] = D_E_act["D_DH"]
-    elif exchange_type == "HH":
-        pD = pH_read
-        pKD = 14.17
-        k_reference = {"D": 3.88, "E": 4.35, "H": 7.11}  # HH
-        activation_energy["D"] = D_E_act["D_HH"]
-    else:
-        raise ValueError(f"Unsupported exchange type '{exchange_type}'")
+    pD, pKD, k_reference, activation_energy = _exchange_parameters(
+        exchange_type, pH_read, d_percentage, ph_correction
+    )
 
     conc_D = 10.0**-pD
     conc_OD = 10.0 ** (pD - pKD)
 
-    try:
-        k_acid_ref, k_base_ref, k_water_ref = rates_cat[(exchange_type, reference)]
-    except KeyError:
-        raise
-
     sequence = list(sequence)
     sequence.insert(0, "NT")
     sequence.append("CT")
 
     # Rates without inductive effects from neighbours, corrected for temperature
-    k_acid = k_acid_ref * np.exp(-E_act["acid"] * (1 / temperature - 1 / 293) / R)
-    k_base = k_base_ref * np.exp(-E_act["base"] * (1 / temperature - 1 / 293) / R)
-    k_water = k_water_ref * np.exp(-E_act["water"] * (1 / temperature - 1 / 293) / R)
+    k_acid, k_base, k_water = _reference_rates(temperature, reference, exchange_type)
 
     side_chain_dict = get_side_chain_dictionary(
         temperature, pD, k_reference, activation_energy
@@ -326,3 +362,616 @@ def k_int_from_sequence(
         return np.array(k_int).sum(axis=1)
     else:
         return np.array(k_int)
+
+
+def _pair_log_factors(sequence, side_chain_dict, wildcard):
+    """
+    Log10 acid and base neighbour factors of residues 1 to n - 1 of `sequence`, without terminal corrections.
+
+    Returns the acid factors, base factors and a boolean mask of residues which have zero rate.
+    """
+
+    unknown = np.array([residue == wildcard for residue in sequence])
+    proline = np.array([residue in ["P", "Pc"] for residue in sequence])
+    blank = np.zeros(4)
+    factors = np.array(
+        [
+            blank if residue == wildcard else side_chain_dict[residue]
+            for residue in sequence
+        ]
+    )
+
+    # Format is left_acid, right_acid, left_base, right_base
+    log_Fa = factors[:-1, 1] + factors[1:, 0]
+    log_Fb = factors[1:, 2] + factors[:-1, 3]
+
+    # Proline or unknown residues are set to zero rate
+    zero = proline[1:] | unknown[1:] | unknown[:-1]
+
+    return log_Fa, log_Fb, zero
+
+
+def _pair_rates(log_Fa, log_Fb, zero, k_acid, k_base, k_water, conc_D, conc_OD):
+    """Acid, base and water exchange rates as a 2D array from log10 neighbour factors."""
+    Fa = np.where(zero, 0.0, 10**log_Fa)
+    Fb = np.where(zero, 0.0, 10**log_Fb)
+
+    k_int = np.empty((len(zero), 3))
+    k_int[:, 0] = Fa * k_acid * conc_D
+    k_int[:, 1] = Fb * k_base * conc_OD
+    k_int[:, 2] = Fb * k_water
+
+    return k_int
+
+
+def _rate_components(
+    sequence, side_chain_dict, k_acid, k_base, k_water, conc_D, conc_OD, wildcard
+):
+    """
+    Vectorized calculation of acid, base and water exchange rates as a 2D array of shape (len(sequence), 3).
+
+    Gives the same results as the per-residue calculation in :func:`k_int_from_sequence`.
+    """
+
+    sequence = list(sequence)
+    if len(sequence) < 3:
+        raise ValueError("Sequence needs a minimum length of 3")
+
+    log_Fa, log_Fb, zero = _pair_log_factors(sequence, side_chain_dict, wildcard)
+    log_Fa[0] += side_chain_dict["NT"][1]
+    log_Fb[0] += side_chain_dict["NT"][3]
+    log_Fa[-1] += side_chain_dict["CT"][0]
+    log_Fb[-1] += side_chain_dict["CT"][2]
+
+    k_int = np.empty((len(sequence), 3))
+    k_int[0] = np.inf
+    k_int[1:] = _pair_rates(
+        log_Fa, log_Fb, zero, k_acid, k_base, k_water, conc_D, conc_OD
+    )
+
+    return k_int
+
+
+class RateGrid(object):
+    """
+    Fast approximate intrinsic rates from side chain modifiers precomputed on a (pD, temperature) grid.
+
+    The pH and temperature dependent side chain modifiers (residues D, E, H and the acid lambda of the C-terminus) are
+    tabulated once on a regular grid in pD and 1/T and bilinearly interpolated for each query. All other terms are
+    evaluated exactly.
+
+    Parameters
+    ----------
+    exchange_type: :obj:`str`
+        The type of exchange. Options are `HD`, `DH` or `HH`.
+    pH_range: :obj:`tuple`
+        Lower and upper bound of the grid in pD, this is the pH value after correction (if any).
+    temperature_range: :obj:`tuple`
+        Lower and upper bound of the grid in temperature (Kelvin).
+    pH_step: :obj:`float`
+        Maximum grid spacing in pD.
+    n_temperature: :obj:`int`
+        Number of grid points along 1/T.
+
+    Attributes
+    ----------
+    max_log_error: :obj:`float`
+        Upper bound on the absolute error in any interpolated side chain modifier (log10 units).
+    max_error: :obj:`float`
+        Upper bound on the relative error of the returned rates with respect to :func:`k_int_from_sequence`.
+
+    Notes
+    -----
+    Each modifier has the form :math:`f = \\log_{10}(10^{a - pD} + 10^{b - pK}) - \\log_{10}(10^{-pK} + 10^{-pD})`
+    where :math:`pK` is linear in 1/T with slope :math:`m = E_a / (R \\ln 10)`. The second derivatives are bounded by
+    :math:`|f_{pD,pD}| \\leq \\ln(10) / 4` and :math:`|f_{1/T,1/T}| \\leq m^2 \\ln(10) / 4`, such that the bilinear
+    interpolation error is at most :math:`\\ln(10) / 32 \\, (h_{pD}^2 + (m h_{1/T})^2)`. Rates depend on at most three
+    interpolated modifiers (acid rate of a C-terminal residue), giving a relative error of at most
+    :math:`10^{3 \\epsilon} - 1`.
+    """
+
+    def __init__(
+        self,
+        exchange_type="HD",
+        pH_range=(1.0, 13.0),
+        temperature_range=(273.15, 373.15),
+        pH_step=0.02,
+        n_temperature=101,
+    ):
+        self.exchange_type = exchange_type
+        _, self.pKD, self.k_reference, self.activation_energy = _exchange_parameters(
+            exchange_type, pH_range[0], 0.0, False
+        )
+
+        n_pH = int(np.ceil((pH_range[1] - pH_range[0]) / pH_step)) + 1
+        self.pD = np.linspace(pH_range[0], pH_range[1], n_pH)
+        self.inv_T = np.linspace(
+            1 / temperature_range[1], 1 / temperature_range[0], n_temperature
+        )
+        self.pH_range = pH_range
+        self.temperature_range = temperature_range
+
+        side_chain_array = _load_side_chain_constants()
+        self._constants = {
+            elem["short_name"]: np.array(list(elem)[2:]) for elem in side_chain_array
+        }
+
+        # Grid values are D, E, H modifiers (4 each) followed by the C-terminal acid lambda
+        self._values = np.empty((n_pH, n_temperature, 13))
+        pD = self.pD[:, np.newaxis, np.newaxis]
+        for i, residue in enumerate(["D", "E", "H"]):
+            k_corrected = _corrected_pKa(
+                self.k_reference[residue],
+                self.activation_energy[residue],
+                1 / self.inv_T,
+            )[np.newaxis, :, np.newaxis]
+
+            deprotenated = self._constants[residue + "0"]
+            protenated = self._constants[residue + "+"]
+            self._values[..., 4 * i : 4 * (i + 1)] = _ionization_modifier(
+                protenated, deprotenated, pD, k_corrected
+            )
+            if residue == "E":
+                self._values[..., 12] = _ionization_modifier(
+                    0.05, 0.96, pD, k_corrected
+                )[..., 0]
+
+        h_pD = np.diff(self.pD).max() if n_pH > 1 else 0.0
+        h_inv_T = np.diff(self.inv_T).max() if n_temperature > 1 else 0.0
+        slope = max(self.activation_energy[r] for r in ["D", "E", "H"]) / (
+            R * np.log(10)
+        )
+        self.max_log_error = np.log(10) / 32 * (h_pD**2 + (slope * h_inv_T) ** 2)
+        self.max_error = 10 ** (3 * self.max_log_error) - 1
+
+    @staticmethod
+    def _grid_position(value, grid, name):
+        lower, upper = min(grid[0], grid[-1]), max(grid[0], grid[-1])
+        if not lower <= value <= upper:
+            raise ValueError(f"{name} value {value} is outside of the grid range")
+        if len(grid) == 1:
+            return 0, 0.0
+        x = (value - grid[0]) / (grid[-1] - grid[0]) * (len(grid) - 1)
+        i = min(int(x), len(grid) - 2)
+
+        return i, x - i
+
+    def get_side_chain_dictionary(self, temperature, pD):
+        """
+        Returns a dictionary with inductive effects of side chains, with interpolated values for D, E, H and CT.
+
+        Parameters
+        ----------
+        temperature: :obj:`float`
+            Temperature in Kelvin.
+        pD: :obj:`float`
+            pH/pD value (after correction).
+
+        Returns
+        -------
+
+        constants: :obj:`dict`
+            Dictionary of side chain modifiers. Values are: (acid_lambda, acid_rho, base_lambda, base_rho)
+        """
+
+        i, fx = self._grid_position(pD, self.pD, "pD")
+        j, fy = self._grid_position(1 / temperature, self.inv_T, "Temperature")
+        i1, j1 = min(i + 1, len(self.pD) - 1), min(j + 1, len(self.inv_T) - 1)
+
+        values = (
+            (1 - fx) * (1 - fy) * self._values[i, j]
+            + fx * (1 - fy) * self._values[i1, j]
+            + (1 - fx) * fy * self._values[i, j1]
+            + fx * fy * self._values[i1, j1]
+        )
+
+        side_chain_dict = {k: v.copy() for k, v in self._constants.items()}
+        for n, residue in enumerate(["D", "E", "H"]):
+            side_chain_dict[residue] = values[4 * n : 4 * (n + 1)]
+        side_chain_dict["CT"][0] = values[12]
+
+        return side_chain_dict
+
+    def k_int_from_sequence(
+        self,
+        sequence,
+        temperature,
+        pH_read,
+        reference="poly",
+        d_percentage=100.0,
+        ph_correction=True,
+        wildcard="X",
+        return_sum=True,
+    ):
+        """
+        Approximate intrisic rates of exchange for amide hydrogens in proteins, interpolated from the grid.
+
+        Parameters are as in :func:`k_int_from_sequence`, where the exchange type is set by the grid. The (corrected)
+        pH and temperature must be within the range of the grid.
+
+        Returns
+        -------
+        rates : :class:`~numpy.ndarray`
+            Array with exchange rates in units of per second.
+        """
+
+        pD, pKD, _, _ = _exchange_parameters(
+            self.exchange_type, pH_read, d_percentage, ph_correction
+        )
+        conc_D = 10.0**-pD
+        conc_OD = 10.0 ** (pD - pKD)
+        k_acid, k_base, k_water = _reference_rates(
+            temperature, reference, self.exchange_type
+        )
+
+        side_chain_dict = self.get_side_chain_dictionary(temperature, pD)
+        k_int = _rate_components(
+            sequence,
+            side_chain_dict,
+            k_acid,
+            k_base,
+            k_water,
+            conc_D,
+            conc_OD,
+            wildcard,
+        )
+
+        if return_sum:
+            return k_int.sum(axis=1)
+        else:
+            return k_int
+
+
+def _codes_dtype(n_categories):
+    """Smallest integer dtype for categorical codes, as chosen by pandas."""
+    for dtype in [np.int8, np.int16, np.int32]:
+        if n_categories < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def _categorical_codes(values):
+    """
+    Encodes `values` as integer codes into sorted categories.
+    """
+    lookup = {}
+    codes = [lookup.setdefault(value, len(lookup)) for value in values]
+    categories = sorted(lookup)
+    remap = np.array([categories.index(value) for value in lookup], dtype=int)
+
+    return (
+        remap[np.array(codes, dtype=int)].astype(_codes_dtype(len(categories))),
+        categories,
+    )
+
+
+class BatchRates(object):
+    """
+    Intrinsic exchange rates of a batch of sequences, stored in contiguous columnar buffers.
+
+    Rates of the `i`-th sequence are found at positions ``offsets[i]:offsets[i + 1]`` of each column. Columns are
+    exported to :class:`pandas.DataFrame` or :class:`pyarrow.Table` without copying the numeric data.
+
+    Parameters
+    ----------
+    names: :obj:`list`
+        Names of the sequences in the batch.
+    offsets: :class:`~numpy.ndarray`
+        Start positions of each sequence in the columns, followed by the total number of residues.
+    residue_codes: :class:`~numpy.ndarray`
+        Integer codes of the residues into `residue_categories`.
+    residue_categories: :obj:`list`
+        Residue codes (single-letter or 'Pc', 'C2', wildcard) of the categories.
+    components: :class:`~numpy.ndarray`
+        2D array of shape (3, N) with acid, base and water exchange rates in units of per second.
+    """
+
+    columns = ["protein", "index", "residue", "k_acid", "k_base", "k_water", "k_int"]
+
+    def __init__(self, names, offsets, residue_codes, residue_categories, components):
+        self.names = list(names)
+        self.offsets = offsets
+        self.residue_codes = residue_codes
+        self.residue_categories = residue_categories
+        self.components = components
+
+        lengths = np.diff(offsets)
+        self.protein_codes = np.repeat(
+            np.arange(len(self.names), dtype=_codes_dtype(len(self.names))),
+            lengths,
+        )
+        self.index = np.arange(offsets[-1]) - np.repeat(offsets[:-1], lengths)
+        self.total = components.sum(axis=0)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, name):
+        """Total exchange rates of the sequence `name`, as a view on the underlying buffer."""
+        i = self.names.index(name)
+        return self.total[self.offsets[i] : self.offsets[i + 1]]
+
+    def _data(self):
+        return [
+            self.protein_codes,
+            self.index,
+            self.residue_codes,
+            self.components[0],
+            self.components[1],
+            self.components[2],
+            self.total,
+        ]
+
+    def to_pandas(self):
+        """
+        Returns the rates as a :class:`pandas.DataFrame`.
+
+        Numeric columns share memory with the batch buffers, protein names and residues are categoricals.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("Exporting to a DataFrame requires pandas")
+
+        data = dict(zip(self.columns, self._data()))
+        data["protein"] = pd.Categorical.from_codes(
+            self.protein_codes, categories=self.names
+        )
+        data["residue"] = pd.Categorical.from_codes(
+            self.residue_codes, categories=self.residue_categories
+        )
+
+        return pd.DataFrame(data, copy=False)
+
+    def to_arrow(self):
+        """
+        Returns the rates as a :class:`pyarrow.Table`.
+
+        Numeric columns share memory with the batch buffers, protein names and residues are dictionary encoded.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("Exporting to an Arrow table requires pyarrow")
+
+        arrays = [pa.array(column) for column in self._data()]
+        arrays[0] = pa.DictionaryArray.from_arrays(arrays[0], pa.array(self.names))
+        arrays[2] = pa.DictionaryArray.from_arrays(
+            arrays[2], pa.array(self.residue_categories)
+        )
+
+        return pa.Table.from_arrays(arrays, names=self.columns)
+
+
+def k_int_from_sequences(
+    sequences,
+    temperature,
+    pH_read,
+    reference="poly",
+    exchange_type="HD",
+    d_percentage=100.0,
+    ph_correction=True,
+    wildcard="X",
+):
+    """
+    Calculated intrisic rates of exchange for amide hydrogens for a batch of proteins.
+
+    Parameters are as in :func:`k_int_from_sequence`, except for `sequences`.
+
+    Parameters
+    ----------
+    sequences: :obj:`dict` or iterable
+        Dictionary of protein name: sequence or iterable of sequences. Sequences without a name are named by their
+        position in the batch.
+
+    Returns
+    -------
+    rates : :class:`BatchRates`
+        Acid, base, water and total exchange rates in units of per second of all sequences.
+    """
+
+    if isinstance(sequences, dict):
+        names, sequences = list(sequences.keys()), list(sequences.values())
+    else:
+        sequences = list(sequences)
+        names = [str(i) for i in range(len(sequences))]
+    sequences = [list(sequence) for sequence in sequences]
+
+    pD, pKD, k_reference, activation_energy = _exchange_parameters(
+        exchange_type, pH_read, d_percentage, ph_correction
+    )
+    conc_D = 10.0**-pD
+    conc_OD = 10.0 ** (pD - pKD)
+    k_acid, k_base, k_water = _reference_rates(temperature, reference, exchange_type)
+    side_chain_dict = get_side_chain_dictionary(
+        temperature, pD, k_reference, activation_energy
+    )
+
+    offsets = np.zeros(len(sequences) + 1, dtype=int)
+    np.cumsum([len(sequence) for sequence in sequences], out=offsets[1:])
+    components = np.empty((3, offsets[-1]))
+    for sequence, start, stop in zip(sequences, offsets[:-1], offsets[1:]):
+        components[:, start:stop] = _rate_components(
+            sequence,
+            side_chain_dict,
+            k_acid,
+            k_base,
+            k_water,
+            conc_D,
+            conc_OD,
+            wildcard,
+        ).T
+
+    residue_codes, residue_categories = _categorical_codes(
+        residue for sequence in sequences for residue in sequence
+    )
+
+    return BatchRates(names, offsets, residue_codes, residue_categories, components)
+
+
+def _range_argbest(values, starts, stops, better):
+    """
+    Index of the best of `values` in each range `starts[i]:stops[i]` from a sparse table of range-best indices.
+
+    Ties resolve to the lowest index. Empty ranges return -1.
+    """
+    levels = [np.arange(len(values))]
+    width = 1
+    while 2 * width <= len(values):
+        left, right = levels[-1][:-width], levels[-1][width:]
+        levels.append(np.where(better(values[right], values[left]), right, left))
+        width *= 2
+
+    result = np.full(len(starts), -1)
+    lengths = stops - starts
+    level = np.frexp(np.maximum(lengths, 1))[1] - 1  # floor(log2(length))
+    for k in np.unique(level[lengths > 0]):
+        select = (lengths > 0) & (level == k)
+        left = levels[k][starts[select]]
+        right = levels[k][stops[select] - 2**k]
+        result[select] = np.where(better(values[right], values[left]), right, left)
+
+    return result
+
+
+def peptide_statistics(
+    sequence,
+    peptides,
+    temperature,
+    pH_read,
+    reference="poly",
+    exchange_type="HD",
+    d_percentage=100.0,
+    ph_correction=True,
+    wildcard="X",
+):
+    """
+    Aggregate intrinsic exchange rates of peptides of a parent sequence, without calculating per-residue rates for
+    each peptide.
+
+    Statistics are identical to those of the rates returned by :func:`k_int_from_sequence` for the peptide sequence.
+    Interior rates only depend on pairs of residues in the parent sequence and are aggregated by prefix sums and a
+    sparse table, the N- and C-terminal corrected rates of each peptide are evaluated separately.
+
+    Other parameters are as in :func:`k_int_from_sequence`.
+
+    Parameters
+    ----------
+    sequence: iterable object
+        Parent sequence in single-letter amino acid codes. Use 'Pc' for cis Proline, 'C2' for Cystine (disulfide)
+    peptides: array_like
+        Array of shape (N, 2) with start and stop (exclusive) indices of peptides in the parent sequence.
+
+    Returns
+    -------
+    statistics : :class:`~numpy.ndarray`
+        Structured array with one row per peptide and fields:
+            start, stop: start and stop indices of the peptide
+            k_sum: sum of exchange rates in units of per second, excluding the N-terminal residue
+            mean_log_k: mean of log10 exchange rates of the exchangeable amides (NaN if there are none)
+            n_exchangeable: number of amides with nonzero finite rate
+            fastest, slowest: index in the parent sequence of the fastest and slowest exchangeable amide (-1 if there
+            are none)
+
+    """
+
+    sequence = list(sequence)
+    peptides = np.asarray(peptides, dtype=int).reshape(-1, 2)
+    starts, stops = peptides[:, 0], peptides[:, 1]
+    if np.any(starts < 0) or np.any(stops > len(sequence)):
+        raise ValueError("Peptide indices out of range of the parent sequence")
+    if np.any(stops - starts < 3):
+        raise ValueError("Peptides need a minimum length of 3")
+
+    pD, pKD, k_reference, activation_energy = _exchange_parameters(
+        exchange_type, pH_read, d_percentage, ph_correction
+    )
+    conc_D = 10.0**-pD
+    conc_OD = 10.0 ** (pD - pKD)
+    k_acid, k_base, k_water = _reference_rates(temperature, reference, exchange_type)
+    side_chain_dict = get_side_chain_dictionary(
+        temperature, pD, k_reference, activation_energy
+    )
+    rate_constants = (k_acid, k_base, k_water, conc_D, conc_OD)
+
+    # Total rates at each position of the parent sequence as interior, second (N-term) or last (C-term) residue
+    log_Fa, log_Fb, zero = _pair_log_factors(sequence, side_chain_dict, wildcard)
+    interior, nterm, cterm = np.zeros((3, len(sequence)))
+    interior[1:] = _pair_rates(log_Fa, log_Fb, zero, *rate_constants).sum(axis=1)
+    nterm[1:] = _pair_rates(
+        log_Fa + side_chain_dict["NT"][1],
+        log_Fb + side_chain_dict["NT"][3],
+        zero,
+        *rate_constants,
+    ).sum(axis=1)
+    cterm[1:] = _pair_rates(
+        log_Fa + side_chain_dict["CT"][0],
+        log_Fb + side_chain_dict["CT"][2],
+        zero,
+        *rate_constants,
+    ).sum(axis=1)
+
+    exchangeable = interior > 0
+    log_k = np.log10(interior, out=np.zeros_like(interior), where=exchangeable)
+    cumulative_k = np.concatenate([[0.0], np.cumsum(interior)])
+    cumulative_n = np.concatenate([[0], np.cumsum(exchangeable)])
+    cumulative_log_k = np.concatenate([[0.0], np.cumsum(log_k)])
+
+    # Interior residues of the peptides, and their second and last residue
+    first, last = starts + 2, stops - 1
+    k_nterm, k_cterm = nterm[starts + 1], cterm[stops - 1]
+    terminal_log_k = [
+        np.log10(k, out=np.zeros_like(k), where=k > 0) for k in [k_nterm, k_cterm]
+    ]
+
+    statistics = np.empty(
+        len(peptides),
+        dtype=[
+            ("start", int),
+            ("stop", int),
+            ("k_sum", float),
+            ("mean_log_k", float),
+            ("n_exchangeable", int),
+            ("fastest", int),
+            ("slowest", int),
+        ],
+    )
+    statistics["start"] = starts
+    statistics["stop"] = stops
+    statistics["k_sum"] = cumulative_k[last] - cumulative_k[first] + k_nterm + k_cterm
+    n_exchangeable = (
+        cumulative_n[last] - cumulative_n[first] + (k_nterm > 0) + (k_cterm > 0)
+    )
+    statistics["n_exchangeable"] = n_exchangeable
+    log_sum = cumulative_log_k[last] - cumulative_log_k[first] + sum(terminal_log_k)
+    statistics["mean_log_k"] = np.divide(
+        log_sum,
+        n_exchangeable,
+        out=np.full(len(peptides), np.nan),
+        where=n_exchangeable > 0,
+    )
+
+    for field, missing, better in [
+        ("fastest", -np.inf, np.greater),
+        ("slowest", np.inf, np.less),
+    ]:
+        values = np.where(exchangeable, interior, missing)
+        best_interior = _range_argbest(values, first, last, better)
+        candidates = np.stack([starts + 1, best_interior, stops - 1], axis=1)
+        candidate_values = np.stack(
+            [
+                np.where(k_nterm > 0, k_nterm, missing),
+                np.where(best_interior >= 0, values[best_interior], missing),
+                np.where(k_cterm > 0, k_cterm, missing),
+            ],
+            axis=1,
+        )
+        choice = (
+            candidate_values.argmax(axis=1)
+            if better is np.greater
+            else candidate_values.argmin(axis=1)
+        )
+        best = candidates[np.arange(len(peptides)), choice]
+        statistics[field] = np.where(n_exchangeable > 0, best, -1)
+
+    return statistics
@@ -1,7 +1,12 @@
 """Tests for `hdxrate` package."""
 
 import numpy as np
-from hdxrate import k_int_from_sequence
+from hdxrate import (
+    k_int_from_sequence,
+    k_int_from_sequences,
+    peptide_statistics,
+    RateGrid,
+)
 from hdxrate.hdxrate import get_side_chain_dictionary, E_act
 from pathlib import Path
 from functools import reduce
@@ -193,3 +198,89 @@ def test_3ala_ref(seq3):
 
     expected = np.ones_like(rel_diff[1:]) * 1.01505365
     assert np.allclose(rel_diff[1:], expected)
+
+
+@pytest.mark.parametrize("exchange_type", ["HD", "DH", "HH"])
+def test_rate_grid(seq2, exchange_type):
+    grid = RateGrid(exchange_type, pH_range=(4.0, 10.0), temperature_range=(275, 310))
+    seq = seq2 + ["Pc", "C2", "X", "A", "H", "D", "E"]
+
+    rng = np.random.default_rng(43)
+    pH_values = rng.uniform(4.0, 9.6, 20)
+    temperatures = rng.uniform(275, 310, 20)
+    for pH_read, temperature in zip(pH_values, temperatures):
+        exact = k_int_from_sequence(
+            seq, temperature, pH_read, exchange_type=exchange_type, return_sum=False
+        )
+        approx = grid.k_int_from_sequence(seq, temperature, pH_read, return_sum=False)
+
+        assert np.array_equal(exact == 0, approx == 0)
+        assert np.array_equal(np.isinf(exact), np.isinf(approx))
+        m = (exact > 0) & np.isfinite(exact)
+        assert np.all(np.abs(approx[m] / exact[m] - 1) <= grid.max_error)
+
+    with pytest.raises(ValueError):
+        grid.k_int_from_sequence(seq, 320, 7.0)
+
+
+def test_k_int_from_sequences(seq1, seq2):
+    sequences = {
+        "seq1": seq1,
+        "seq2": seq2,
+        "wildcard": ["M", "K", "Pc", "X", "H", "E"],
+    }
+    batch = k_int_from_sequences(sequences, 279, 6.6, exchange_type="HD")
+
+    assert len(batch) == 3
+    assert batch.offsets.tolist() == [
+        0,
+        len(seq1),
+        len(seq1) + len(seq2),
+        6 + len(seq1) + len(seq2),
+    ]
+    for name, sequence in sequences.items():
+        rates = k_int_from_sequence(sequence, 279, 6.6, exchange_type="HD")
+        assert np.allclose(batch[name], rates)
+
+    pytest.importorskip("pandas")
+    df = batch.to_pandas()
+    assert list(df.columns) == batch.columns
+    assert df["residue"].tolist() == seq1 + seq2 + sequences["wildcard"]
+    assert df["protein"].iloc[len(seq1)] == "seq2"
+    assert np.shares_memory(df["k_base"].to_numpy(), batch.components)
+    assert np.shares_memory(df["k_int"].to_numpy(), batch.total)
+    assert np.shares_memory(df["residue"].array.codes, batch.residue_codes)
+
+    pytest.importorskip("pyarrow")
+    table = batch.to_arrow()
+    assert table.column("residue").to_pylist() == df["residue"].tolist()
+    assert np.shares_memory(
+        table.column("k_acid").chunk(0).to_numpy(zero_copy_only=True), batch.components
+    )
+
+
+def test_peptide_statistics(seq2):
+    parent = seq2[:60] + ["Pc", "A", "X", "G", "H", "C2", "D", "X", "X", "E", "P"]
+    peptides = [(0, 3), (0, len(parent)), (5, 12), (58, 66), (62, 69), (66, 69)]
+    peptides += [(i, i + n) for i in range(0, 60, 7) for n in [3, 4, 9, 14]]
+
+    statistics = peptide_statistics(parent, peptides, 290, 7.1, exchange_type="HD")
+    assert len(statistics) == len(peptides)
+    for row, (start, stop) in zip(statistics, peptides):
+        rates = k_int_from_sequence(parent[start:stop], 290, 7.1, exchange_type="HD")
+        rates = rates[1:]
+        exchangeable = rates > 0
+        index = np.arange(start + 1, stop)[exchangeable]
+
+        assert np.isclose(row["k_sum"], rates.sum())
+        assert row["n_exchangeable"] == exchangeable.sum()
+        if exchangeable.any():
+            assert np.isclose(row["mean_log_k"], np.log10(rates[exchangeable]).mean())
+            assert row["fastest"] == index[np.argmax(rates[exchangeable])]
+            assert row["slowest"] == index[np.argmin(rates[exchangeable])]
+        else:
+            assert np.isnan(row["mean_log_k"])
+            assert row["fastest"] == row["slowest"] == -1
+
+    with pytest.raises(ValueError):
+        peptide_statistics(parent, [(0, 2)], 290, 7.1)